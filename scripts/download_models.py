@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Download required MediaPipe model files."""
+import shutil
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -15,20 +17,41 @@ MODELS = {
     ),
 }
 
+CHUNK_SIZE = 128 * 1024
+
+# Shared session so downloads reuse pooled connections and TLS sessions
+_SESSION = requests.Session()
+
 
 def download_model(name, url, models_dir):
-    """Download a model file."""
+    """Download a model file.
+
+    The server ETag is stored next to the model; when present it is sent as
+    If-None-Match so an unchanged model is revalidated without re-downloading.
+    """
     filepath = models_dir / name
+    etag_path = filepath.with_suffix('.etag')
+    headers = {}
     if filepath.exists():
-        print(f"  {name} already exists")
-        return True
+        if not etag_path.exists():
+            print(f"  {name} already exists")
+            return True
+        headers['If-None-Match'] = etag_path.read_text().strip()
     print(f"  Downloading {name}...")
     try:
-        response = requests.get(url, stream=True)
+        response = _SESSION.get(url, stream=True, headers=headers)
+        if response.status_code == 304:
+            response.close()
+            print(f"  {name} is up to date")
+            return True
         response.raise_for_status()
         with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            # Copy the raw stream in C with a 128 KB buffer
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+        etag = response.headers.get('ETag')
+        if etag:
+            etag_path.write_text(etag)
         print(f"  {name} downloaded successfully")
         return True
     except Exception as e:
@@ -45,10 +68,13 @@ def main():
     print(f"Models directory: {models_dir}")
     print("-" * 50)
 
-    success = True
-    for name, url in MODELS.items():
-        if not download_model(name, url, models_dir):
-            success = False
+    # Downloads are independent and I/O-bound, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(MODELS)) as executor:
+        results = list(executor.map(
+            lambda item: download_model(item[0], item[1], models_dir),
+            MODELS.items()
+        ))
+    success = all(results)
 
     print("-" * 50)
     if success:
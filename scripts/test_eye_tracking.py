@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test eye tracking independently."""
+import os
 import sys
+import time
 import cv2
 from pathlib import Path
 
@@ -11,8 +13,13 @@ from eyetracking.eye_tracker import EyeTracker
 
 
 def main():
+    # HEADLESS=1 skips all drawing and display (e.g. for CI or FPS measurement);
+    # stop with Ctrl+C or cap the run with MAX_FRAMES=<n>
+    headless = os.environ.get('HEADLESS') == '1'
+    max_frames = int(os.environ.get('MAX_FRAMES', '0'))
+
     print("Testing Eye Tracking...")
-    print("Press 'q' to quit")
+    print("Press Ctrl+C to quit" if headless else "Press 'q' to quit")
     print("-" * 40)
 
     tracker = EyeTracker()
@@ -29,33 +36,56 @@ def main():
     print("Camera opened")
     print("Eye tracker ready")
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    # Bind hot-loop OpenCV lookups to locals
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    circle = cv2.circle
+    put_text = cv2.putText
+    imshow = cv2.imshow
+    wait_key = cv2.waitKey
+
+    frame_count = 0
+    start = time.perf_counter()
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame_count += 1
+
+            data = tracker.process_frame(frame)
+
+            if not headless and data['landmarks']:
+                tracker.draw_landmarks(frame, data['landmarks'])
 
-        data = tracker.process_frame(frame)
+            if data['gaze_point']:
+                gx, gy = data['gaze_point']
+                text = f"Gaze ({gx:.2f}, {gy:.2f})"
+                if not headless:
+                    h, w = frame.shape[:2]
+                    px, py = int(gx * w), int(gy * h)
+                    circle(frame, (px, py), 10, (0, 0, 255), -1)
+                    circle(frame, (px, py), 15, (0, 0, 255), 2)
+                    put_text(frame, text, (10, 50), font, 0.7, (0, 0, 255), 2)
+                print(f"\r{text}", end='')
 
-        if data['landmarks']:
-            tracker.draw_landmarks(frame, data['landmarks'])
+            if headless:
+                if max_frames and frame_count >= max_frames:
+                    break
+                continue
 
-        if data['gaze_point']:
-            gx, gy = data['gaze_point']
-            h, w, _ = frame.shape
-            px, py = int(gx * w), int(gy * h)
-            cv2.circle(frame, (px, py), 10, (0, 0, 255), -1)
-            cv2.circle(frame, (px, py), 15, (0, 0, 255), 2)
-            text = f"Gaze ({gx:.2f}, {gy:.2f})"
-            cv2.putText(frame, text, (10, 50),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-            print(f"\r{text}", end='')
+            imshow('Eye Tracking Test', frame)
+            if wait_key(1) & 0xFF == ord('q'):
+                break
+    except KeyboardInterrupt:
+        pass
 
-        cv2.imshow('Eye Tracking Test', frame)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
+    elapsed = time.perf_counter() - start
+    if elapsed > 0:
+        print(f"\nProcessed {frame_count} frames at {frame_count / elapsed:.1f} FPS")
 
     cap.release()
-    cv2.destroyAllWindows()
+    if not headless:
+        cv2.destroyAllWindows()
     print("\nTest completed")
     return 0
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test gesture recognition independently."""
+import os
 import sys
+import time
 import cv2
 from pathlib import Path
 
@@ -11,8 +13,13 @@ from gesture.gesture_recognizer import GestureRecognizer
 
 
 def main():
+    # HEADLESS=1 skips all drawing and display (e.g. for CI or FPS measurement);
+    # stop with Ctrl+C or cap the run with MAX_FRAMES=<n>
+    headless = os.environ.get('HEADLESS') == '1'
+    max_frames = int(os.environ.get('MAX_FRAMES', '0'))
+
     print("Testing Gesture Recognition...")
-    print("Press 'q' to quit")
+    print("Press Ctrl+C to quit" if headless else "Press 'q' to quit")
     print("-" * 40)
 
     recognizer = GestureRecognizer()
@@ -29,28 +36,50 @@ def main():
     print("Camera opened")
     print("Gesture recognizer ready")
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    # Bind hot-loop OpenCV lookups to locals
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    put_text = cv2.putText
+    imshow = cv2.imshow
+    wait_key = cv2.waitKey
+
+    frame_count = 0
+    start = time.perf_counter()
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame_count += 1
+
+            gesture_data = recognizer.process_frame(frame)
+
+            if not headless and gesture_data['landmarks']:
+                recognizer.draw_landmarks(frame, gesture_data['landmarks'])
 
-        gesture_data = recognizer.process_frame(frame)
+            if gesture_data['gesture']:
+                text = f"{gesture_data['gesture']} ({gesture_data['confidence']:.2f})"
+                if not headless:
+                    put_text(frame, text, (10, 50), font, 1, (0, 255, 0), 2)
+                print(f"\rDetected: {text}", end='')
 
-        if gesture_data['landmarks']:
-            recognizer.draw_landmarks(frame, gesture_data['landmarks'])
+            if headless:
+                if max_frames and frame_count >= max_frames:
+                    break
+                continue
 
-        if gesture_data['gesture']:
-            text = f"{gesture_data['gesture']} ({gesture_data['confidence']:.2f})"
-            cv2.putText(frame, text, (10, 50),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-            print(f"\rDetected: {text}", end='')
+            imshow('Gesture Test', frame)
+            if wait_key(1) & 0xFF == ord('q'):
+                break
+    except KeyboardInterrupt:
+        pass
 
-        cv2.imshow('Gesture Test', frame)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
+    elapsed = time.perf_counter() - start
+    if elapsed > 0:
+        print(f"\nProcessed {frame_count} frames at {frame_count / elapsed:.1f} FPS")
 
     cap.release()
-    cv2.destroyAllWindows()
+    if not headless:
+        cv2.destroyAllWindows()
     print("\nTest completed")
     return 0
 
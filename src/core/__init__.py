@@ -1,11 +1,12 @@
 """Core module for Virtual Desktop Controller."""
 
 from .camera import Camera
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, get_config_manager
 from .logger import setup_logger
 
 __all__ = [
     'Camera',
     'ConfigManager',
+    'get_config_manager',
     'setup_logger'
 ]
@@ -7,6 +7,9 @@ from typing import Optional, Tuple, Any
 logger = logging.getLogger(__name__)
 
 class Camera:
+    __slots__ = ('width', 'height', 'fps', 'camera_id', 'cap', 'is_running',
+                 'thread', '_frames', '_latest_idx', '_frame_cond', '_frame_seq')
+
     def __init__(self, width: int = 1280, height: int = 720, fps: int = 30, camera_id: int = 0):
         self.width = width
         self.height = height
@@ -16,8 +19,13 @@ class Camera:
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_running = False
         self.thread: Optional[threading.Thread] = None
-        self.current_frame = None
-        self.lock = threading.Lock()
+        # Two-slot frame buffer: the capture thread fills the slot that is not
+        # currently published, then flips the index (an atomic int assignment).
+        self._frames = [None, None]
+        self._latest_idx = 0
+        # Signalled once per captured frame so consumers can block instead of polling
+        self._frame_cond = threading.Condition()
+        self._frame_seq = 0
 
     def start(self):
         """Start the camera capture in a separate thread."""
@@ -29,6 +37,10 @@ class Camera:
             if not self.cap.isOpened():
                 raise RuntimeError(f"Could not open camera {self.camera_id}")
             
+            # Keep only the newest frame queued so reads are never stale
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            # MJPG lets most webcams deliver 720p at full frame rate (YUYV often caps ~10fps)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
             self.cap.set(cv2.CAP_PROP_FPS, self.fps)
@@ -52,23 +64,43 @@ class Camera:
         logger.info("Camera stopped")
 
     def _capture_loop(self):
-        """Dedicated thread for frame capturing."""
+        """Dedicated thread for frame capturing.
+
+        ``cap.read()`` blocks until the driver has a frame, so the loop is paced
+        by the camera itself and needs no sleep.
+        """
         while self.is_running and self.cap and self.cap.isOpened():
             ret, frame = self.cap.read()
             if ret:
-                with self.lock:
-                    self.current_frame = frame
+                next_idx = 1 - self._latest_idx
+                self._frames[next_idx] = frame
+                self._latest_idx = next_idx
+                with self._frame_cond:
+                    self._frame_seq += 1
+                    self._frame_cond.notify_all()
             else:
                 logger.warning("Failed to grab frame")
                 time.sleep(0.1)
-            
-            # Simple FPS limiting if needed, though waitKey/sleep in loop is better handled
-            # by just reading as fast as camera provides or letting opencv handle it.
-            time.sleep(0.001)
 
     def get_frame(self) -> Tuple[bool, Optional[Any]]:
-        """Get the latest frame from the buffer."""
-        with self.lock:
-            if self.current_frame is None:
-                return False, None
-            return True, self.current_frame.copy()
+        """Get the latest frame from the buffer.
+
+        The returned frame is shared, not copied; consumers must not mutate it.
+        """
+        frame = self._frames[self._latest_idx]
+        return frame is not None, frame
+
+    def wait_for_frame(self, last_seq: int, timeout: Optional[float] = None) -> Tuple[int, Optional[Any]]:
+        """Block until a frame newer than last_seq is captured.
+
+        Args:
+            last_seq: Sequence number returned by the previous call (0 initially)
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            Tuple of (seq, frame). seq equals last_seq if the wait timed out.
+            The frame is shared, not copied; consumers must not mutate it.
+        """
+        with self._frame_cond:
+            self._frame_cond.wait_for(lambda: self._frame_seq != last_seq, timeout)
+            return self._frame_seq, self._frames[self._latest_idx]
@@ -1,56 +1,84 @@
+import functools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-class ConfigManager:
-    _instance = None
+# Raw config file contents keyed by path, stored as (mtime, bytes) so unchanged
+# files are not re-read. Bytes are cached rather than parsed data so every
+# ConfigManager parses its own config_data and instances never share mutable state.
+_CACHE: Dict[str, Tuple[float, bytes]] = {}
+
+_MISSING = object()
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._instance.initialized = False
-        return cls._instance
 
+class ConfigManager:
     def __init__(self):
-        if self.initialized:
-            return
-        
         self.project_root = Path(__file__).parent.parent.parent
         self.config_dir = self.project_root / "config"
         self.config_data: Dict[str, Any] = {}
-        self.initialized = True
+        # Memoized dot-notation lookups; cleared whenever configs are reloaded
+        self._lookup = functools.lru_cache(maxsize=256)(self._resolve)
         self.load_configs()
 
     def load_configs(self):
         """Load all configuration files from the config directory."""
+        self._lookup.cache_clear()
         if not self.config_dir.exists():
             logger.warning(f"Config directory not found: {self.config_dir}")
             return
 
-        for config_file in self.config_dir.glob("*.json"):
-            try:
-                with open(config_file, 'r') as f:
-                    self.config_data[config_file.stem] = json.load(f)
-                logger.info(f"Loaded config: {config_file.name}")
-            except Exception as e:
-                logger.error(f"Failed to load config {config_file.name}: {e}")
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                    cached = _CACHE.get(entry.path)
+                    if cached is not None and cached[0] == mtime:
+                        raw = cached[1]
+                    else:
+                        with open(entry.path, 'rb') as f:
+                            raw = f.read()
+                        _CACHE[entry.path] = (mtime, raw)
+                    self.config_data[entry.name[:-5]] = _loads(raw)
+                    logger.info(f"Loaded config: {entry.name}")
+                except Exception as e:
+                    logger.error(f"Failed to load config {entry.name}: {e}")
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation (e.g., 'hardware_config.resolution')."""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def _resolve(self, key: str) -> Any:
+        """Walk the dot-notation path for key, returning _MISSING if absent."""
         keys = key.split('.')
         value = self.config_data
-        
+
         for k in keys:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         return value
 
     @property
     def hardware_tier(self) -> str:
         """Get the configured hardware tier."""
         return self.get("hardware_config.tier", "mid")
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Return the shared ConfigManager, creating it on first use."""
+    return ConfigManager()
@@ -32,3 +32,14 @@ def exponential_smoothing(current, previous, alpha):
     if previous is None:
         return current
     return alpha * current + (1 - alpha) * previous
+
+def average_hash(frame, size=8):
+    """Compute a perceptual average hash (aHash) of a BGR frame.
+
+    The frame is shrunk to size x size, converted to grayscale and each pixel
+    is thresholded against the mean, giving size*size bits packed into bytes.
+    Identical hashes mean the frames are visually near-identical at a coarse level.
+    """
+    tiny = cv2.resize(frame, (size, size), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(tiny, cv2.COLOR_BGR2GRAY)
+    return np.packbits(gray > gray.mean()).tobytes()
@@ -14,6 +14,7 @@ class CalibrationManager:
         self.calibration_points: List[Dict] = []
         self.mapping_matrix_x = None
         self.mapping_matrix_y = None
+        self._mapping_matrix = None
         self.is_calibrated = False
         logger.info("CalibrationManager initialized")
 
@@ -23,6 +24,7 @@ class CalibrationManager:
         self.is_calibrated = False
         self.mapping_matrix_x = None
         self.mapping_matrix_y = None
+        self._mapping_matrix = None
         logger.info("Calibration reset")
 
     def collect_sample(self, screen_x: float, screen_y: float,
@@ -56,34 +58,25 @@ class CalibrationManager:
             return False
 
         try:
-            iris_matrix = []
-            screen_x_vec = []
-            screen_y_vec = []
-
-            for point in self.calibration_points:
-                ix, iy = point['iris']
-                sx, sy = point['screen']
-                iris_matrix.append([ix, iy, 1])
-                screen_x_vec.append(sx)
-                screen_y_vec.append(sy)
-
-            A = np.array(iris_matrix)
-            Bx = np.array(screen_x_vec)
-            By = np.array(screen_y_vec)
-
-            # Least squares regression
-            res_x = np.linalg.lstsq(A, Bx, rcond=None)
-            res_y = np.linalg.lstsq(A, By, rcond=None)
-
-            self.mapping_matrix_x = res_x[0]
-            self.mapping_matrix_y = res_y[0]
+            n = len(self.calibration_points)
+            A = np.empty((n, 3))
+            B = np.empty((n, 2))
+            for i, point in enumerate(self.calibration_points):
+                A[i, 0], A[i, 1] = point['iris']
+                A[i, 2] = 1.0
+                B[i, 0], B[i, 1] = point['screen']
+
+            # Least squares regression, solving X and Y in one factorization
+            coeffs, residuals, *_ = np.linalg.lstsq(A, B, rcond=None)
+
+            self.mapping_matrix_x = coeffs[:, 0]
+            self.mapping_matrix_y = coeffs[:, 1]
+            # (2, 3) matrix so map_to_screen needs a single matmul per call
+            self._mapping_matrix = np.ascontiguousarray(coeffs.T)
             self.is_calibrated = True
 
-            # Calculate residual error
-            residuals_x = res_x[1] if len(res_x[1]) > 0 else [0]
-            residuals_y = res_y[1] if len(res_y[1]) > 0 else [0]
-            error_x = residuals_x[0] if len(residuals_x) > 0 else 0
-            error_y = residuals_y[0] if len(residuals_y) > 0 else 0
+            # Calculate residual error (empty when the system is rank-deficient)
+            error_x, error_y = residuals if len(residuals) > 0 else (0, 0)
 
             logger.info(f"Calibration successful with {len(self.calibration_points)} points")
             logger.info(f"  X coefficients: {self.mapping_matrix_x}")
@@ -109,14 +102,11 @@ class CalibrationManager:
 
         try:
             ix, iy = iris_data
-            v = np.array([ix, iy, 1])
-            sx = np.dot(v, self.mapping_matrix_x)
-            sy = np.dot(v, self.mapping_matrix_y)
+            sxy = self._mapping_matrix @ (ix, iy, 1.0)
 
             # Clamp to 0-1 range
-            sx = max(0.0, min(1.0, sx))
-            sy = max(0.0, min(1.0, sy))
-            return sx, sy
+            np.clip(sxy, 0.0, 1.0, out=sxy)
+            return float(sxy[0]), float(sxy[1])
 
         except Exception as e:
             logger.error(f"Mapping error: {e}")
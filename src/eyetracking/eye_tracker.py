@@ -1,10 +1,13 @@
 """Eye tracking and gaze estimation using MediaPipe Tasks API."""
 import cv2
 import logging
+import time
 import numpy as np
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional, List
 
+from core.utils import resize_frame
+
 try:
     import mediapipe as mp
     from mediapipe.tasks.python import BaseOptions
@@ -25,18 +28,29 @@ class EyeTracker:
     RIGHT_IRIS_CENTER = 473
     LEFT_EYE_LANDMARKS = [33, 133, 160, 159, 158, 144, 145, 153]
     RIGHT_EYE_LANDMARKS = [263, 362, 387, 386, 385, 373, 374, 380]
+    # Eye contour points followed by the two iris centers, drawn in one batch
+    _DRAW_IDX = LEFT_EYE_LANDMARKS + RIGHT_EYE_LANDMARKS + [LEFT_IRIS_CENTER, RIGHT_IRIS_CENTER]
 
     def __init__(self, min_detection_confidence: float = 0.5,
-                 min_tracking_confidence: float = 0.5):
+                 min_tracking_confidence: float = 0.5,
+                 inference_width: Optional[int] = 640,
+                 input_is_rgb: bool = False):
         """Initialize eye tracker.
 
         Args:
             min_detection_confidence: Minimum confidence for face detection
             min_tracking_confidence: Minimum confidence for tracking
+            inference_width: Frames wider than this are downscaled (keeping aspect
+                ratio) before inference; None disables downscaling
+            input_is_rgb: Frames passed to process_frame are already RGB, so
+                the BGR->RGB conversion is skipped
         """
         self.landmarker = None
-        self._timestamp_ms = 0
+        self.inference_width = inference_width
+        self._last_ts = 0
         self.current_gaze = None
+        self._rgb_buf = None
+        self._input_is_rgb = input_is_rgb
 
         if not HAS_MEDIAPIPE:
             logger.error("MediaPipe not installed. Eye tracking disabled.")
@@ -47,22 +61,43 @@ class EyeTracker:
             logger.error("Face landmarker model not found. Eye tracking disabled.")
             return
 
+        # Prefer the GPU delegate, falling back to CPU where it is unavailable
+        for delegate in (BaseOptions.Delegate.GPU, BaseOptions.Delegate.CPU):
+            try:
+                options = FaceLandmarkerOptions(
+                    base_options=BaseOptions(model_asset_path=str(model_path), delegate=delegate),
+                    running_mode=RunningMode.VIDEO,
+                    num_faces=1,
+                    min_face_detection_confidence=min_detection_confidence,
+                    min_face_presence_confidence=min_detection_confidence,
+                    min_tracking_confidence=min_tracking_confidence,
+                    output_face_blendshapes=False,
+                    output_facial_transformation_matrixes=False
+                )
+                self.landmarker = FaceLandmarker.create_from_options(options)
+                logger.info("EyeTracker initialized with Tasks API model: %s (%s delegate)",
+                            model_path.name, delegate.name)
+                break
+            except Exception as e:
+                logger.warning("Failed to initialize FaceLandmarker with %s delegate: %s", delegate.name, e)
+                self.landmarker = None
+
+        if self.landmarker is None:
+            logger.error("Failed to initialize FaceLandmarker")
+            return
+
+        self._warm_up()
+
+    def _warm_up(self):
+        """Run one inference on a black frame so graph setup happens at startup
+        rather than stalling the first real frame."""
         try:
-            options = FaceLandmarkerOptions(
-                base_options=BaseOptions(model_asset_path=str(model_path)),
-                running_mode=RunningMode.VIDEO,
-                num_faces=1,
-                min_face_detection_confidence=min_detection_confidence,
-                min_face_presence_confidence=min_detection_confidence,
-                min_tracking_confidence=min_tracking_confidence,
-                output_face_blendshapes=False,
-                output_facial_transformation_matrixes=False
-            )
-            self.landmarker = FaceLandmarker.create_from_options(options)
-            logger.info(f"EyeTracker initialized with Tasks API model: {model_path.name}")
+            dummy = np.zeros((480, 640, 3), dtype=np.uint8)
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=dummy)
+            self.landmarker.detect_for_video(mp_image, 0)
+            self._last_ts = 0
         except Exception as e:
-            logger.error(f"Failed to initialize FaceLandmarker: {e}")
-            self.landmarker = None
+            logger.debug(f"FaceLandmarker warm-up skipped: {e}")
 
     def _find_model_file(self) -> Optional[Path]:
         """Find the face_landmarker.task model file.
@@ -99,44 +134,55 @@ class EyeTracker:
         if frame is None or self.landmarker is None:
             return {'gaze_point': None, 'landmarks': None, 'iris_left': None, 'iris_right': None}
 
+        # Landmarks are normalized, so they still map onto the full-size frame
+        if self.inference_width and frame.shape[1] > self.inference_width:
+            frame = resize_frame(frame, width=self.inference_width)
+        if self._input_is_rgb:
+            rgb_frame = frame
+        else:
+            # Convert to RGB (MediaPipe requirement) into a reused buffer
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # Video mode needs strictly increasing timestamps; use real frame timing
+        ts = int(time.monotonic() * 1000)
+        if ts <= self._last_ts:
+            ts = self._last_ts + 1
+        self._last_ts = ts
+
         try:
-            # Convert to RGB (MediaPipe requirement)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            # Create MediaPipe Image
+            # Create MediaPipe Image (copies the data, so the buffer can be reused)
             mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
-            # Increment timestamp for video mode
-            self._timestamp_ms += 33  # ~30 FPS
             # Detect face
-            results = self.landmarker.detect_for_video(mp_image, self._timestamp_ms)
-
-            tracker_data = {
-                'gaze_point': None,
-                'landmarks': None,
-                'iris_left': None,
-                'iris_right': None
-            }
+            results = self.landmarker.detect_for_video(mp_image, ts)
+        except Exception as e:
+            logger.error("Error running face landmarker: %s", e)
+            return {'gaze_point': None, 'landmarks': None, 'iris_left': None, 'iris_right': None}
 
-            if results.face_landmarks and len(results.face_landmarks) > 0:
-                face_landmarks = results.face_landmarks[0]
-                tracker_data['landmarks'] = face_landmarks
+        tracker_data = {
+            'gaze_point': None,
+            'landmarks': None,
+            'iris_left': None,
+            'iris_right': None
+        }
 
-                # Extract iris centers for gaze estimation
-                left_iris = face_landmarks[self.LEFT_IRIS_CENTER]
-                right_iris = face_landmarks[self.RIGHT_IRIS_CENTER]
+        if results.face_landmarks and len(results.face_landmarks) > 0:
+            face_landmarks = results.face_landmarks[0]
+            tracker_data['landmarks'] = face_landmarks
 
-                tracker_data['iris_left'] = (left_iris.x, left_iris.y)
-                tracker_data['iris_right'] = (right_iris.x, right_iris.y)
+            # Extract iris centers for gaze estimation, reading each landmark once
+            lm = face_landmarks[self.LEFT_IRIS_CENTER]
+            lx, ly = lm.x, lm.y
+            lm = face_landmarks[self.RIGHT_IRIS_CENTER]
+            rx, ry = lm.x, lm.y
 
-                # Average iris positions for central gaze point
-                gaze_x = (left_iris.x + right_iris.x) / 2
-                gaze_y = (left_iris.y + right_iris.y) / 2
-                tracker_data['gaze_point'] = (gaze_x, gaze_y)
+            tracker_data['iris_left'] = (lx, ly)
+            tracker_data['iris_right'] = (rx, ry)
 
-            return tracker_data
+            # Average iris positions for central gaze point
+            tracker_data['gaze_point'] = ((lx + rx) / 2, (ly + ry) / 2)
 
-        except Exception as e:
-            logger.error(f"Error processing frame: {e}")
-            return {'gaze_point': None, 'landmarks': None, 'iris_left': None, 'iris_right': None}
+        return tracker_data
 
     def draw_landmarks(self, frame, landmarks):
         """Draw eye landmarks on frame (optional visualization).
@@ -148,19 +194,19 @@ class EyeTracker:
         if landmarks is None:
             return
         try:
-            h, w, _ = frame.shape
-            # Draw left eye landmarks
-            for idx in self.LEFT_EYE_LANDMARKS:
-                lm = landmarks[idx]
-                cv2.circle(frame, (int(lm.x * w), int(lm.y * h)), 2, (0, 255, 0), -1)
-            # Draw right eye landmarks
-            for idx in self.RIGHT_EYE_LANDMARKS:
-                lm = landmarks[idx]
-                cv2.circle(frame, (int(lm.x * w), int(lm.y * h)), 2, (0, 255, 0), -1)
+            h, w = frame.shape[:2]
+            # Extract all needed coordinates once and scale to pixels in one pass
+            pts = np.fromiter(
+                (v for i in self._DRAW_IDX for v in (landmarks[i].x, landmarks[i].y)),
+                dtype=np.float32, count=len(self._DRAW_IDX) * 2
+            ).reshape(-1, 2)
+            pts *= (w, h)
+            pts = pts.astype(np.int32)
+            # Draw eye landmarks
+            for x, y in pts[:-2]:
+                cv2.circle(frame, (int(x), int(y)), 2, (0, 255, 0), -1)
             # Draw iris centers
-            left_iris = landmarks[self.LEFT_IRIS_CENTER]
-            right_iris = landmarks[self.RIGHT_IRIS_CENTER]
-            cv2.circle(frame, (int(left_iris.x * w), int(left_iris.y * h)), 5, (255, 0, 0), -1)
-            cv2.circle(frame, (int(right_iris.x * w), int(right_iris.y * h)), 5, (255, 0, 0), -1)
+            for x, y in pts[-2:]:
+                cv2.circle(frame, (int(x), int(y)), 5, (255, 0, 0), -1)
         except Exception as e:
             logger.error(f"Error drawing landmarks: {e}")
@@ -4,10 +4,10 @@ import numpy as np
 from typing import Optional, Tuple
 
 try:
-    from filterpy.kalman import KalmanFilter
-    HAS_FILTERPY = True
+    from simdkalman import KalmanFilter
+    HAS_SIMDKALMAN = True
 except ImportError:
-    HAS_FILTERPY = False
+    HAS_SIMDKALMAN = False
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,8 @@ class KalmanTracker:
     """Kalman filter for smoothing eye gaze tracking output.
 
     Reduces jitter and noise in iris/gaze position estimates.
-    Falls back to simple moving average if filterpy is not available.
+    The x and y coordinates are smoothed by one batched constant-velocity
+    filter. Falls back to simple moving average if simdkalman is not available.
     """
 
     def __init__(self, process_noise: float = 1e-3, measurement_noise: float = 1e-1):
@@ -26,35 +27,35 @@ class KalmanTracker:
             process_noise: Process noise covariance (lower = smoother, higher = more responsive)
             measurement_noise: Measurement noise covariance
         """
-        self._kf_x = None
-        self._kf_y = None
+        self._kf = None
+        self._mean = None
+        self._cov = None
         self._initialized = False
-        self._fallback_window = []
         self._window_size = 5
-
-        if HAS_FILTERPY:
-            self._init_kalman_filters(process_noise, measurement_noise)
-            logger.info("KalmanTracker initialized with filterpy")
+        # Moving-average fallback ring buffer
+        self._buf = np.zeros((self._window_size, 2))
+        self._idx = 0
+        self._count = 0
+
+        if HAS_SIMDKALMAN:
+            self._init_kalman_filter(process_noise, measurement_noise)
+            logger.info("KalmanTracker initialized with simdkalman")
         else:
-            logger.warning("filterpy not available. Using moving average fallback.")
-
-    def _init_kalman_filters(self, process_noise: float, measurement_noise: float):
-        """Initialize two separate Kalman filters for x and y coordinates."""
-        # X coordinate filter
-        self._kf_x = KalmanFilter(dim_x=2, dim_z=1)
-        self._kf_x.F = np.array([[1, 1], [0, 1]])  # State transition
-        self._kf_x.H = np.array([[1, 0]])           # Measurement function
-        self._kf_x.R *= measurement_noise            # Measurement noise
-        self._kf_x.Q *= process_noise                # Process noise
-        self._kf_x.P *= 1.0                         # Initial covariance
-
-        # Y coordinate filter
-        self._kf_y = KalmanFilter(dim_x=2, dim_z=1)
-        self._kf_y.F = np.array([[1, 1], [0, 1]])
-        self._kf_y.H = np.array([[1, 0]])
-        self._kf_y.R *= measurement_noise
-        self._kf_y.Q *= process_noise
-        self._kf_y.P *= 1.0
+            logger.warning("simdkalman not available. Using moving average fallback.")
+
+    def _init_kalman_filter(self, process_noise: float, measurement_noise: float):
+        """Initialize one Kalman filter shared by the x and y coordinates.
+
+        State per coordinate is (position, velocity); both coordinates are
+        stacked along the first axis and updated in a single vectorized step.
+        """
+        self._kf = KalmanFilter(
+            state_transition=np.array([[1.0, 1.0], [0.0, 1.0]]),  # State transition
+            process_noise=np.eye(2) * process_noise,              # Process noise
+            observation_model=np.array([[1.0, 0.0]]),             # Measurement function
+            observation_noise=np.array([[measurement_noise]])     # Measurement noise
+        )
+        self._measurement = np.zeros((2, 1, 1))
 
     def update(self, gaze_point: Optional[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
         """Update the Kalman filter with a new gaze measurement.
@@ -70,27 +71,29 @@ class KalmanTracker:
 
         x, y = gaze_point
 
-        if HAS_FILTERPY and self._kf_x is not None:
+        if self._kf is not None:
             return self._kalman_update(x, y)
         else:
             return self._moving_average_update(x, y)
 
     def _kalman_update(self, x: float, y: float) -> Tuple[float, float]:
         """Update using Kalman filter."""
+        self._measurement[0, 0, 0] = x
+        self._measurement[1, 0, 0] = y
+
         if not self._initialized:
             # Initialize filter state with first measurement
-            self._kf_x.x = np.array([[x], [0]])
-            self._kf_y.x = np.array([[y], [0]])
+            self._mean = np.zeros((2, 2, 1))
+            self._mean[:, 0, 0] = (x, y)
+            self._cov = np.tile(np.eye(2), (2, 1, 1))  # Initial covariance
             self._initialized = True
 
-        # Predict and update
-        self._kf_x.predict()
-        self._kf_x.update(np.array([[x]]))
-        self._kf_y.predict()
-        self._kf_y.update(np.array([[y]]))
+        # Predict and update both coordinates at once
+        prior_mean, prior_cov = self._kf.predict_next(self._mean, self._cov)
+        self._mean, self._cov, _ = self._kf.update(prior_mean, prior_cov, self._measurement)
 
-        smoothed_x = float(self._kf_x.x[0])
-        smoothed_y = float(self._kf_y.x[0])
+        smoothed_x = float(self._mean[0, 0, 0])
+        smoothed_y = float(self._mean[1, 0, 0])
 
         # Clamp to valid range
         smoothed_x = max(0.0, min(1.0, smoothed_x))
@@ -100,19 +103,16 @@ class KalmanTracker:
 
     def _moving_average_update(self, x: float, y: float) -> Tuple[float, float]:
         """Fallback: simple moving average smoothing."""
-        self._fallback_window.append((x, y))
-        if len(self._fallback_window) > self._window_size:
-            self._fallback_window.pop(0)
+        self._buf[self._idx] = (x, y)
+        self._idx = (self._idx + 1) % self._window_size
+        self._count = min(self._count + 1, self._window_size)
 
-        avg_x = sum(p[0] for p in self._fallback_window) / len(self._fallback_window)
-        avg_y = sum(p[1] for p in self._fallback_window) / len(self._fallback_window)
-        return avg_x, avg_y
+        avg = self._buf[:self._count].mean(axis=0)
+        return float(avg[0]), float(avg[1])
 
     def reset(self):
         """Reset the Kalman filter state."""
         self._initialized = False
-        self._fallback_window = []
-        if HAS_FILTERPY and self._kf_x is not None:
-            self._kf_x.P *= 1.0
-            self._kf_y.P *= 1.0
+        self._idx = 0
+        self._count = 0
         logger.info("KalmanTracker reset")
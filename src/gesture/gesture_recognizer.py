@@ -1,13 +1,16 @@
 """Gesture recognition using MediaPipe Tasks API."""
 import cv2
 import logging
-import os
+import threading
+import time
+import numpy as np
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from core.utils import resize_frame
+
 try:
     import mediapipe as mp
-    from mediapipe.tasks import python as mp_python
     from mediapipe.tasks.python import BaseOptions
     from mediapipe.tasks.python.vision import HandLandmarker, HandLandmarkerOptions
     from mediapipe.tasks.python.vision import RunningMode
@@ -21,20 +24,54 @@ logger = logging.getLogger(__name__)
 class GestureRecognizer:
     """Hand gesture recognition using MediaPipe Tasks API."""
 
+    # Hand landmark indices
+    NUM_LANDMARKS = 21
+    THUMB_IP = 3
+    THUMB_TIP = 4
+    INDEX_TIP = 8
+    # Index, middle, ring and pinky finger tips and their PIP joints
+    _FINGER_TIPS = np.array([8, 12, 16, 20])
+    _FINGER_PIPS = np.array([6, 10, 14, 18])
+    # Landmark index pairs joined when drawing the hand skeleton
+    _HAND_CONNECTIONS = np.array([
+        (0, 1), (1, 2), (2, 3), (3, 4),    # Thumb
+        (0, 5), (5, 6), (6, 7), (7, 8),    # Index
+        (0, 9), (9, 10), (10, 11), (11, 12),  # Middle
+        (0, 13), (13, 14), (14, 15), (15, 16),  # Ring
+        (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
+        (5, 9), (9, 13), (13, 17)           # Palm
+    ])
+
     def __init__(self, min_detection_confidence: float = 0.7,
                  min_tracking_confidence: float = 0.5,
-                 max_num_hands: int = 1):
+                 max_num_hands: int = 1,
+                 inference_width: Optional[int] = 320,
+                 input_is_rgb: bool = False):
         """Initialize gesture recognizer.
 
         Args:
             min_detection_confidence: Minimum confidence for hand detection
             min_tracking_confidence: Minimum confidence for tracking
             max_num_hands: Maximum number of hands to detect
+            inference_width: Frames wider than this are downscaled (keeping aspect
+                ratio) before inference; None disables downscaling
+            input_is_rgb: Frames passed to process_frame are already RGB, so
+                the BGR->RGB conversion is skipped
         """
         self.landmarker = None
-        self._timestamp_ms = 0
+        self.inference_width = inference_width
+        self._last_result = None
+        # HandLandmarker result _last_result was built from
+        self._last_source = None
+        self._last_ts = 0
+        # Most recent asynchronous HandLandmarker result (LIVE_STREAM mode)
+        self._latest_result = None
+        self._result_lock = threading.Lock()
         self.current_gesture = None
         self.confidence = 0.0
+        self._rgb_buf = None
+        self._input_is_rgb = input_is_rgb
+        self._lm = np.empty((self.NUM_LANDMARKS, 2))
 
         if not HAS_MEDIAPIPE:
             logger.error("MediaPipe not installed. Gesture recognition disabled.")
@@ -45,34 +82,47 @@ class GestureRecognizer:
             logger.error("Hand landmarker model not found. Gesture recognition disabled.")
             return
 
-        try:
-            options = HandLandmarkerOptions(
-                base_options=BaseOptions(model_asset_path=str(model_path)),
-                running_mode=RunningMode.VIDEO,
-                num_hands=max_num_hands,
-                min_hand_detection_confidence=min_detection_confidence,
-                min_hand_presence_confidence=min_detection_confidence,
-                min_tracking_confidence=min_tracking_confidence
-            )
-            self.landmarker = HandLandmarker.create_from_options(options)
-            logger.info(f"GestureRecognizer initialized with Tasks API model: {model_path}")
-        except Exception as e:
-            logger.error(f"Failed to initialize HandLandmarker: {e}")
-            self.landmarker = None
+        # Prefer the GPU delegate, falling back to CPU where it is unavailable
+        for delegate in (BaseOptions.Delegate.GPU, BaseOptions.Delegate.CPU):
+            try:
+                options = HandLandmarkerOptions(
+                    base_options=BaseOptions(model_asset_path=str(model_path), delegate=delegate),
+                    running_mode=RunningMode.LIVE_STREAM,
+                    result_callback=self._on_result,
+                    num_hands=max_num_hands,
+                    min_hand_detection_confidence=min_detection_confidence,
+                    min_hand_presence_confidence=min_detection_confidence,
+                    min_tracking_confidence=min_tracking_confidence
+                )
+                self.landmarker = HandLandmarker.create_from_options(options)
+                logger.info("GestureRecognizer initialized with Tasks API model: %s (%s delegate)",
+                            model_path, delegate.name)
+                break
+            except Exception as e:
+                logger.warning("Failed to initialize HandLandmarker with %s delegate: %s", delegate.name, e)
+                self.landmarker = None
+
+        if self.landmarker is None:
+            logger.error("Failed to initialize HandLandmarker")
 
     def _find_model_file(self) -> Optional[Path]:
-        """Find the hand_landmarker.task model file.
+        """Find the hand landmarker model file.
+
+        An INT8-quantized hand_landmarker_int8.task is preferred when present,
+        falling back to the default hand_landmarker.task.
 
         Returns:
             Path to model file or None if not found
         """
         project_root = Path(__file__).parent.parent.parent
-        search_paths = [
-            project_root / "models" / "hand_landmarker.task",
-            project_root / "hand_landmarker.task",
-            Path("models/hand_landmarker.task"),
-            Path("hand_landmarker.task"),
-        ]
+        search_paths = []
+        for name in ("hand_landmarker_int8.task", "hand_landmarker.task"):
+            search_paths += [
+                project_root / "models" / name,
+                project_root / name,
+                Path("models") / name,
+                Path(name),
+            ]
         for path in search_paths:
             if path.exists():
                 return path.resolve()
@@ -82,6 +132,9 @@ class GestureRecognizer:
     def process_frame(self, frame: Any) -> Dict[str, Any]:
         """Process frame and detect gestures.
 
+        Detection runs asynchronously, so the returned data describes the most
+        recently completed frame rather than necessarily this one.
+
         Args:
             frame: BGR image from OpenCV
 
@@ -93,35 +146,76 @@ class GestureRecognizer:
         if frame is None or self.landmarker is None:
             return {'gesture': None, 'landmarks': None, 'confidence': 0.0, 'handedness': None}
 
+        # Landmarks are normalized, so they still map onto the full-size frame
+        if self.inference_width and frame.shape[1] > self.inference_width:
+            frame = resize_frame(frame, width=self.inference_width)
+        if self._input_is_rgb:
+            rgb_frame = frame
+        else:
+            # Convert to RGB (MediaPipe requirement) into a reused buffer
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # Live stream mode needs strictly increasing timestamps; use real frame timing
+        ts = int(time.monotonic() * 1000)
+        if ts <= self._last_ts:
+            ts = self._last_ts + 1
+        self._last_ts = ts
+
         try:
-            # Convert to RGB (MediaPipe requirement)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            # Create MediaPipe Image
+            # Create MediaPipe Image (copies the data, so the buffer can be reused)
             mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
-            # Increment timestamp for video mode
-            self._timestamp_ms += 33  # ~30 FPS
-            # Detect hands
-            results = self.landmarker.detect_for_video(mp_image, self._timestamp_ms)
+            # Queue hand detection; the result arrives via _on_result
+            self.landmarker.detect_async(mp_image, ts)
+        except Exception as e:
+            logger.error("Error running hand landmarker: %s", e)
+            return {'gesture': None, 'landmarks': None, 'confidence': 0.0, 'handedness': None}
 
-            gesture_data = {'gesture': None, 'landmarks': None, 'confidence': 0.0, 'handedness': None}
+        return self.get_latest_result()
 
-            if results.hand_landmarks and len(results.hand_landmarks) > 0:
-                # Process first detected hand
-                hand_landmarks = results.hand_landmarks[0]
-                gesture_data['landmarks'] = hand_landmarks
-                # Classify gesture
-                gesture, confidence = self._classify_gesture(hand_landmarks)
-                gesture_data['gesture'] = gesture
-                gesture_data['confidence'] = confidence
+    def get_latest_result(self) -> Dict[str, Any]:
+        """Get gesture data for the most recently completed detection.
 
-            if results.handedness and len(results.handedness) > 0:
-                gesture_data['handedness'] = results.handedness[0][0].category_name
+        Does not queue a new frame; the result is classified once and reused
+        until a newer detection arrives.
 
-            return gesture_data
+        Returns:
+            Dictionary with gesture data as returned by process_frame
+        """
+        with self._result_lock:
+            results = self._latest_result
 
-        except Exception as e:
-            logger.error(f"Error processing frame: {e}")
+        if results is None:
             return {'gesture': None, 'landmarks': None, 'confidence': 0.0, 'handedness': None}
+        if results is self._last_source:
+            return self._last_result
+
+        gesture_data = {'gesture': None, 'landmarks': None, 'confidence': 0.0, 'handedness': None}
+        if results.hand_landmarks and len(results.hand_landmarks) > 0:
+            # Process first detected hand
+            hand_landmarks = results.hand_landmarks[0]
+            gesture_data['landmarks'] = hand_landmarks
+            # Classify gesture
+            gesture, confidence = self._classify_gesture(hand_landmarks)
+            gesture_data['gesture'] = gesture
+            gesture_data['confidence'] = confidence
+
+        if results.handedness and len(results.handedness) > 0:
+            gesture_data['handedness'] = results.handedness[0][0].category_name
+
+        self._last_source = results
+        self._last_result = gesture_data
+        return gesture_data
+
+    def _on_result(self, result, output_image, timestamp_ms: int):
+        """Store the latest HandLandmarker result (called from MediaPipe's thread)."""
+        with self._result_lock:
+            self._latest_result = result
+
+    def _landmarks_to_array(self, landmarks: List) -> np.ndarray:
+        """Copy landmark (x, y) coordinates into the preallocated (21, 2) array."""
+        self._lm[:] = [(lm.x, lm.y) for lm in landmarks]
+        return self._lm
 
     def _classify_gesture(self, landmarks: List) -> tuple:
         """Classify gesture from hand landmarks.
@@ -132,57 +226,38 @@ class GestureRecognizer:
         Returns:
             Tuple of (gesture_name, confidence)
         """
-        try:
-            # Landmark indices
-            THUMB_TIP = 4
-            INDEX_TIP = 8
-            MIDDLE_TIP = 12
-            RING_TIP = 16
-            PINKY_TIP = 20
-            INDEX_PIP = 6
-            MIDDLE_PIP = 10
-            RING_PIP = 14
-            PINKY_PIP = 18
-            THUMB_IP = 3
-
-            extended_fingers = 0
-
-            # Check index, middle, ring, pinky: tip above PIP = extended
-            finger_tips = [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]
-            finger_pips = [INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP]
-            for tip, pip in zip(finger_tips, finger_pips):
-                if landmarks[tip].y < landmarks[pip].y:
-                    extended_fingers += 1
-
-            # Check thumb: different logic - check x distance
-            thumb_extended = abs(landmarks[THUMB_TIP].x - landmarks[THUMB_IP].x) > 0.04
-            if thumb_extended:
-                extended_fingers += 1
-
-            if extended_fingers == 0:
-                return 'CLOSED_FIST', 0.9
-            elif extended_fingers >= 4:
-                return 'OPEN_PALM', 0.9
-            elif extended_fingers == 1:
-                # Check if it's index finger
-                if landmarks[INDEX_TIP].y < landmarks[INDEX_PIP].y:
-                    return 'POINTING', 0.9
-            elif extended_fingers == 2:
-                index_extended = landmarks[INDEX_TIP].y < landmarks[INDEX_PIP].y
-                # Check for pinch (thumb + index)
-                if thumb_extended and index_extended:
-                    dist = ((landmarks[THUMB_TIP].x - landmarks[INDEX_TIP].x) ** 2 +
-                            (landmarks[THUMB_TIP].y - landmarks[INDEX_TIP].y) ** 2) ** 0.5
-                    if dist < 0.05:
-                        return 'PINCH', 0.9
-                    else:
-                        return 'PEACE_SIGN', 0.8
-
-            return 'UNKNOWN', 0.5
+        lm = self._landmarks_to_array(landmarks)
 
-        except Exception as e:
-            logger.error(f"Error classifying gesture: {e}")
-            return 'ERROR', 0.0
+        # Check index, middle, ring, pinky: tip above PIP = extended
+        fingers_up = lm[self._FINGER_TIPS, 1] < lm[self._FINGER_PIPS, 1]
+        extended_fingers = int(fingers_up.sum())
+        index_extended = fingers_up[0]
+
+        # Check thumb: different logic - check x distance
+        thumb_extended = abs(lm[self.THUMB_TIP, 0] - lm[self.THUMB_IP, 0]) > 0.04
+        if thumb_extended:
+            extended_fingers += 1
+
+        if extended_fingers == 0:
+            return 'CLOSED_FIST', 0.9
+        elif extended_fingers >= 4:
+            return 'OPEN_PALM', 0.9
+        elif extended_fingers == 1:
+            # Check if it's index finger
+            if index_extended:
+                return 'POINTING', 0.9
+        elif extended_fingers == 2:
+            # Check for pinch (thumb + index)
+            if thumb_extended and index_extended:
+                # Compare squared distance against 0.05 ** 2 to skip the sqrt
+                dx = lm[self.THUMB_TIP, 0] - lm[self.INDEX_TIP, 0]
+                dy = lm[self.THUMB_TIP, 1] - lm[self.INDEX_TIP, 1]
+                if dx * dx + dy * dy < 0.0025:
+                    return 'PINCH', 0.9
+                else:
+                    return 'PEACE_SIGN', 0.8
+
+        return 'UNKNOWN', 0.5
 
     def draw_landmarks(self, frame, landmarks):
         """Draw hand landmarks on frame.
@@ -194,27 +269,12 @@ class GestureRecognizer:
         if landmarks is None:
             return
         try:
-            h, w, _ = frame.shape
-            HAND_CONNECTIONS = [
-                (0, 1), (1, 2), (2, 3), (3, 4),    # Thumb
-                (0, 5), (5, 6), (6, 7), (7, 8),    # Index
-                (0, 9), (9, 10), (10, 11), (11, 12),  # Middle
-                (0, 13), (13, 14), (14, 15), (15, 16),  # Ring
-                (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
-                (5, 9), (9, 13), (13, 17)           # Palm
-            ]
-            # Draw connections
-            for connection in HAND_CONNECTIONS:
-                start_idx, end_idx = connection
-                start = landmarks[start_idx]
-                end = landmarks[end_idx]
-                start_point = (int(start.x * w), int(start.y * h))
-                end_point = (int(end.x * w), int(end.y * h))
-                cv2.line(frame, start_point, end_point, (0, 255, 0), 2)
+            h, w = frame.shape[:2]
+            pts = (np.array([(lm.x, lm.y) for lm in landmarks]) * (w, h)).astype(np.int32)
+            # Draw all connections in a single call
+            cv2.polylines(frame, list(pts[self._HAND_CONNECTIONS]), False, (0, 255, 0), 2)
             # Draw landmarks
-            for landmark in landmarks:
-                x = int(landmark.x * w)
-                y = int(landmark.y * h)
-                cv2.circle(frame, (x, y), 5, (0, 0, 255), -1)
+            for x, y in pts:
+                cv2.circle(frame, (int(x), int(y)), 5, (0, 0, 255), -1)
         except Exception as e:
             logger.error(f"Error drawing landmarks: {e}")
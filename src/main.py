@@ -9,15 +9,13 @@ DIPEX 2026 Project
 import sys
 import logging
 from pathlib import Path
-from PyQt5.QtWidgets import QApplication
 
 # Add src directory to path
 src_path = Path(__file__).parent
 sys.path.insert(0, str(src_path))
 
 from core.logger import setup_logger
-from core.config_manager import ConfigManager
-from ui.main_window import MainWindow
+from core.config_manager import get_config_manager
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +29,14 @@ def main():
         logger.info("Starting Virtual Desktop Controller...")
         
         # Load configuration
-        config = ConfigManager()
+        config = get_config_manager()
         logger.info(f"Configuration loaded. Hardware tier: {config.hardware_tier}")
         
+        # Qt, OpenCV and MediaPipe are imported here, after logging is up,
+        # so importing this module stays cheap
+        from PyQt5.QtWidgets import QApplication
+        from ui.main_window import MainWindow
+
         # Initialize UI Application
         app = QApplication(sys.argv)
         
@@ -0,0 +1,77 @@
+"""Numeric kernels for rolling performance statistics.
+
+Compiled with Numba when it is installed; otherwise the same functions run as
+plain NumPy code.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Eager signatures: compiled (or loaded from cache) at import, not on first frame
+@njit("Tuple((int64, int64, float64, float64))(float64[:], int64, int64, float64, float64)",
+      cache=True, fastmath=True)
+def push_and_mean(buf, idx, count, sample, running_sum):
+    """Push a sample into a ring buffer and return its rolling mean.
+
+    Args:
+        buf: Ring buffer of samples, updated in place
+        idx: Slot the sample is written to
+        count: Number of valid samples in the buffer before this push
+        sample: New sample value
+        running_sum: Sum of the valid samples before this push
+
+    Returns:
+        Tuple of (next_idx, count, running_sum, mean) after the push
+    """
+    size = buf.shape[0]
+    if count == size:
+        running_sum -= buf[idx]
+    else:
+        count += 1
+    buf[idx] = sample
+    running_sum += sample
+    return (idx + 1) % size, count, running_sum, running_sum / count
+
+
+@njit("Tuple((int64, int64, float64, float64, float64, float64))"
+      "(float64[:], int64, int64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def push_and_stats(buf, idx, count, sample, running_sum, running_sq):
+    """Push a sample into a ring buffer and return its rolling mean and std.
+
+    Args:
+        buf: Ring buffer of samples, updated in place
+        idx: Slot the sample is written to
+        count: Number of valid samples in the buffer before this push
+        sample: New sample value
+        running_sum: Sum of the valid samples before this push
+        running_sq: Sum of the squared valid samples before this push
+
+    Returns:
+        Tuple of (next_idx, count, running_sum, running_sq, mean, std) after the push
+    """
+    size = buf.shape[0]
+    if count == size:
+        old = buf[idx]
+        running_sum -= old
+        running_sq -= old * old
+    else:
+        count += 1
+    buf[idx] = sample
+    running_sum += sample
+    running_sq += sample * sample
+    mean = running_sum / count
+    # Clamp tiny negative variances from floating point cancellation
+    var = max(running_sq / count - mean * mean, 0.0)
+    return (idx + 1) % size, count, running_sum, running_sq, mean, np.sqrt(var)
@@ -1,8 +1,11 @@
 """Performance monitoring module."""
 import logging
-import time
+import math
+from time import perf_counter_ns as _pcns
+import numpy as np
 from typing import Dict, Any, Optional
-from collections import deque
+
+from ._kernels import HAS_NUMBA, push_and_mean, push_and_stats
 
 logger = logging.getLogger(__name__)
 
@@ -27,17 +30,33 @@ class PerformanceMonitor:
         # Performance metrics
         self.fps = 0.0
         self.latency_ms = 0.0
+        self.latency_std_ms = 0.0
         self.memory_mb = 0.0
         
-        # Rolling window for averaging
-        self.frame_times = deque(maxlen=window_size)
-        self.latencies = deque(maxlen=window_size)
+        # Rolling window for averaging: preallocated ring buffers
+        self._frame_buf = np.zeros(window_size, dtype=np.float64)
+        self._lat_buf = np.zeros(window_size, dtype=np.float64)
+        self._idx = 0
+        self._count = 0
+        # Running sums of the window contents for O(1) averaging
+        self._frame_time_sum = 0.0
+        self._latency_sum = 0.0
+        self._latency_sq_sum = 0.0
+        
+        # Stats dict updated in place by update(); get_stats() returns it as-is
+        self._stats = {
+            'fps': 0.0,
+            'latency_ms': 0.0,
+            'latency_std_ms': 0.0,
+            'memory_mb': 0.0,
+            'frame_count': 0
+        }
         
-        # Timestamps
-        self.last_frame_time = time.time()
+        # Timestamps (monotonic, integer nanoseconds)
+        self.last_frame_time = _pcns()
         self.is_initialized = False
         
-        logger.info(f"PerformanceMonitor initialized with window_size={window_size}")
+        logger.info("PerformanceMonitor initialized with window_size=%d", window_size)
     
     def initialize(self) -> bool:
         """Initialize performance monitor.
@@ -47,11 +66,11 @@ class PerformanceMonitor:
         """
         try:
             self.is_initialized = True
-            self.last_frame_time = time.time()
+            self.last_frame_time = _pcns()
             logger.info("PerformanceMonitor initialization complete")
             return True
         except Exception as e:
-            logger.error(f"PerformanceMonitor initialization failed: {e}")
+            logger.error("PerformanceMonitor initialization failed: %s", e)
             return False
     
     def update(self, latency_ms: float = 0.0) -> None:
@@ -64,37 +83,75 @@ class PerformanceMonitor:
             return
         
         try:
-            current_time = time.time()
-            frame_time = (current_time - self.last_frame_time) * 1000  # Convert to ms
-            self.last_frame_time = current_time
-            
-            # Store measurements
-            self.frame_times.append(frame_time)
-            self.latencies.append(latency_ms)
+            now = _pcns()
+            frame_time = (now - self.last_frame_time) * 1e-6  # Convert ns to ms
+            self.last_frame_time = now
             
-            # Calculate averages
-            if self.frame_times:
-                avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-                self.fps = 1000.0 / avg_frame_time if avg_frame_time > 0 else 0.0
-            
-            if self.latencies:
-                self.latency_ms = sum(self.latencies) / len(self.latencies)
+            # Store measurements and update rolling statistics
+            idx, count = self._idx, self._count
+            if HAS_NUMBA:
+                self._idx, self._count, self._frame_time_sum, avg_frame_time = push_and_mean(
+                    self._frame_buf, idx, count, frame_time, self._frame_time_sum)
+                (_, _, self._latency_sum, self._latency_sq_sum,
+                 self.latency_ms, self.latency_std_ms) = push_and_stats(
+                    self._lat_buf, idx, count, float(latency_ms),
+                    self._latency_sum, self._latency_sq_sum)
+            else:
+                # Plain Python is faster than calling the uncompiled kernels
+                if count == self.window_size:
+                    old_latency = self._lat_buf[idx]
+                    self._frame_time_sum -= self._frame_buf[idx]
+                    self._latency_sum -= old_latency
+                    self._latency_sq_sum -= old_latency * old_latency
+                else:
+                    count += 1
+                    self._count = count
+                self._frame_buf[idx] = frame_time
+                self._lat_buf[idx] = latency_ms
+                self._idx = (idx + 1) % self.window_size
+                self._frame_time_sum += frame_time
+                self._latency_sum += latency_ms
+                self._latency_sq_sum += latency_ms * latency_ms
+
+                avg_frame_time = self._frame_time_sum / count
+                self.latency_ms = self._latency_sum / count
+                # Clamp tiny negative variances from floating point cancellation
+                variance = self._latency_sq_sum / count - self.latency_ms * self.latency_ms
+                self.latency_std_ms = math.sqrt(variance) if variance > 0 else 0.0
+
+            self.fps = 1000.0 / avg_frame_time if avg_frame_time > 0 else 0.0
+            self._update_stats()
         
         except Exception as e:
-            logger.error(f"Error updating performance metrics: {e}")
+            logger.error("Error updating performance metrics: %s", e)
+    
+    def _update_stats(self) -> None:
+        """Write the current metrics into the shared stats dict."""
+        stats = self._stats
+        stats['fps'] = self.fps
+        stats['latency_ms'] = self.latency_ms
+        stats['latency_std_ms'] = self.latency_std_ms
+        stats['memory_mb'] = self.memory_mb
+        stats['frame_count'] = self._count
     
     def get_stats(self) -> Dict[str, float]:
         """Get current performance statistics.
         
+        The returned dict is reused and updated in place on every update();
+        treat it as read-only and use get_stats_copy() to keep a snapshot.
+        
         Returns:
             Dictionary with performance metrics
         """
-        return {
-            'fps': self.fps,
-            'latency_ms': self.latency_ms,
-            'memory_mb': self.memory_mb,
-            'frame_count': len(self.frame_times)
-        }
+        return self._stats
+    
+    def get_stats_copy(self) -> Dict[str, float]:
+        """Get a snapshot of current performance statistics.
+        
+        Returns:
+            New dictionary with performance metrics
+        """
+        return dict(self._stats)
     
     def get_fps(self) -> float:
         """Get current FPS.
@@ -114,19 +171,23 @@ class PerformanceMonitor:
     
     def reset(self) -> None:
         """Reset all performance metrics."""
-        self.frame_times.clear()
-        self.latencies.clear()
+        self._idx = 0
+        self._count = 0
+        self._frame_time_sum = 0.0
+        self._latency_sum = 0.0
+        self._latency_sq_sum = 0.0
         self.fps = 0.0
         self.latency_ms = 0.0
-        self.last_frame_time = time.time()
+        self.latency_std_ms = 0.0
+        self._update_stats()
+        self.last_frame_time = _pcns()
         logger.info("Performance metrics reset")
     
     def log_stats(self) -> None:
         """Log current performance statistics."""
         stats = self.get_stats()
-        logger.info(f"Performance - FPS: {stats['fps']:.2f}, "
-                   f"Latency: {stats['latency_ms']:.2f}ms, "
-                   f"Memory: {stats['memory_mb']:.2f}MB")
+        logger.info("Performance - FPS: %.2f, Latency: %.2fms, Memory: %.2fMB",
+                    stats['fps'], stats['latency_ms'], stats['memory_mb'])
     
     def shutdown(self) -> None:
         """Shutdown the monitor and release resources."""
@@ -1,4 +1,5 @@
 """UI module."""
 from .main_window import MainWindow
+from .inference_worker import InferenceWorker
 
-__all__ = ['MainWindow']
+__all__ = ['MainWindow', 'InferenceWorker']
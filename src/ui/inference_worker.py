@@ -0,0 +1,152 @@
+"""Background worker running camera capture and tracking inference off the GUI thread."""
+import cv2
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.utils import average_hash
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceWorker(QThread):
+    """Pulls camera frames and runs eye tracking and gesture recognition.
+
+    Emits ``frame_ready(frame, tracker_data, gesture_data)`` for new camera
+    frames. Only one emission is in flight at a time: the receiving slot must
+    call frame_consumed() when it starts, and results produced before then
+    replace each other so the GUI never falls behind. The frame is shared with
+    the camera's capture buffer, so receivers must copy it before drawing on it.
+    """
+
+    # Plain object types so the result dicts reach the slot unconverted; a
+    # dict argument would round-trip through QVariantMap on every emit
+    frame_ready = pyqtSignal(object, object, object)
+
+    def __init__(self, camera, eye_tracker=None, gesture_recognizer=None,
+                 processing_scale: float = 0.5, skip_unchanged_frames: bool = False,
+                 parent=None):
+        """Initialize inference worker.
+
+        Args:
+            camera: Started Camera to pull frames from
+            eye_tracker: EyeTracker to run on each frame, or None to skip
+            gesture_recognizer: GestureRecognizer to run on each frame, or None to skip
+            processing_scale: Factor frames are downscaled by before inference
+            skip_unchanged_frames: Skip inference for frames whose average
+                hash matches one of the last two distinct frames, reusing the
+                eye tracking result and the latest asynchronous gesture result
+            parent: Optional Qt parent object
+        """
+        super().__init__(parent)
+        self.camera = camera
+        self.eye_tracker = eye_tracker
+        self.gesture_recognizer = gesture_recognizer
+        self.processing_scale = processing_scale
+        self.skip_unchanged_frames = skip_unchanged_frames
+        self.is_running = False
+        # frame hash -> tracker_data; two entries so a frame flickering between
+        # two hashes still hits. Gesture results are not cached: the recognizer
+        # runs in live stream mode, so its result lags the frame that was hashed
+        self._result_cache = OrderedDict()
+        self._result_cache_size = 2
+        # Newest result not yet emitted, and whether the GUI still has one queued
+        self._pending = None
+        self._in_flight = False
+        self._pending_lock = threading.Lock()
+
+    def run(self):
+        """Process frames until stop() is called, paced by the camera."""
+        self.is_running = True
+        seq = 0
+        while self.is_running:
+            # Block until the camera captures a new frame; the timeout only
+            # bounds how long stop() waits
+            new_seq, frame = self.camera.wait_for_frame(seq, timeout=0.1)
+            if new_seq == seq or frame is None:
+                # Deliver a result held back while the GUI was busy
+                self._publish()
+                continue
+            seq = new_seq
+
+            tracker_data, gesture_data = self.process(frame)
+            self._publish((frame, tracker_data, gesture_data))
+
+    def _publish(self, result=None):
+        """Emit the newest result unless the GUI has not consumed the previous one.
+
+        Args:
+            result: New (frame, tracker_data, gesture_data) tuple replacing any
+                pending one, or None to only flush the pending result
+        """
+        with self._pending_lock:
+            if result is not None:
+                self._pending = result
+            if self._in_flight or self._pending is None:
+                return
+            result, self._pending = self._pending, None
+            self._in_flight = True
+        self.frame_ready.emit(*result)
+
+    def frame_consumed(self):
+        """Allow the next emission; call at the start of the frame_ready slot."""
+        with self._pending_lock:
+            self._in_flight = False
+
+    def process(self, frame: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run eye tracking and gesture recognition on one frame.
+
+        Args:
+            frame: BGR image from the camera
+
+        Returns:
+            Tuple of (tracker_data, gesture_data) dictionaries
+        """
+        # Downscale once for both trackers; their landmarks are normalized, so
+        # overlays are still drawn on the full-resolution frame without rescaling
+        small = frame
+        if self.processing_scale < 1.0:
+            small = cv2.resize(frame, (0, 0), fx=self.processing_scale, fy=self.processing_scale,
+                               interpolation=cv2.INTER_AREA)
+
+        frame_hash = None
+        if self.skip_unchanged_frames:
+            frame_hash = average_hash(small)
+            cached = self._result_cache.get(frame_hash)
+            if cached is not None:
+                self._result_cache.move_to_end(frame_hash)
+                gesture_data = {'gesture': None, 'landmarks': None, 'confidence': 0.0}
+                if self.gesture_recognizer is not None:
+                    gesture_data = self.gesture_recognizer.get_latest_result()
+                return cached, gesture_data
+
+        # Process eye tracking
+        tracker_data = {'gaze_point': None, 'landmarks': None}
+        if self.eye_tracker is not None:
+            try:
+                tracker_data = self.eye_tracker.process_frame(small)
+            except Exception as e:
+                logger.error("Eye tracking error: %s", e)
+
+        # Process gesture recognition; this only queues the frame with the live
+        # stream landmarker and reads its latest result, so it does not block
+        gesture_data = {'gesture': None, 'landmarks': None, 'confidence': 0.0}
+        if self.gesture_recognizer is not None:
+            try:
+                gesture_data = self.gesture_recognizer.process_frame(small)
+            except Exception as e:
+                logger.error("Gesture processing error: %s", e)
+
+        if frame_hash is not None:
+            self._result_cache[frame_hash] = tracker_data
+            if len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+
+        return tracker_data, gesture_data
+
+    def stop(self):
+        """Stop the worker loop and wait for the thread to finish."""
+        self.is_running = False
+        self.wait()
@@ -1,18 +1,63 @@
 """Main window for Virtual Desktop Controller using MediaPipe Tasks API."""
-import sys
 import cv2
+import functools
 import logging
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QApplication
-from PyQt5.QtCore import QTimer, Qt
+import time
+import numpy as np
+from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QSizePolicy
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QImage, QPixmap
 
 from core.camera import Camera
-from core.config_manager import ConfigManager
+from core.config_manager import get_config_manager
 from gesture.gesture_recognizer import GestureRecognizer
 from eyetracking.eye_tracker import EyeTracker
+from ui.inference_worker import InferenceWorker
 
 logger = logging.getLogger(__name__)
 
+# Overlay drawing constants (BGR)
+_GREEN = (0, 255, 0)
+_RED = (0, 0, 255)
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+@functools.lru_cache(maxsize=32)
+def _render_text(text, scale, thickness):
+    """Rasterize text once into a glyph mask.
+
+    Args:
+        text: String to render
+        scale: Font scale passed to cv2.putText
+        thickness: Stroke thickness passed to cv2.putText
+
+    Returns:
+        Tuple of (mask, ascent, pad): boolean glyph mask, text height above
+        the baseline, and the padding around it
+    """
+    (w, h), baseline = cv2.getTextSize(text, _FONT, scale, thickness)
+    # Some glyphs (e.g. parentheses) extend past the reported text box
+    pad = thickness + h // 2
+    canvas = np.zeros((h + baseline + 2 * pad, w + 2 * pad), dtype=np.uint8)
+    cv2.putText(canvas, text, (pad, pad + h), _FONT, scale, 255, thickness)
+    mask = canvas.astype(bool)
+    mask.setflags(write=False)
+    return mask, h, pad
+
+
+def _draw_text(frame, text, org, scale, color, thickness):
+    """Draw text like cv2.putText using a cached glyph mask."""
+    mask, ascent, pad = _render_text(text, scale, thickness)
+    x, y = org[0] - pad, org[1] - ascent - pad
+    mh, mw = mask.shape
+    fh, fw = frame.shape[:2]
+    # Clip the mask to the frame
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + mw, fw), min(y + mh, fh)
+    if x0 >= x1 or y0 >= y1:
+        return
+    frame[y0:y1, x0:x1][mask[y0 - y:y1 - y, x0 - x:x1 - x]] = color
+
 
 class MainWindow(QMainWindow):
     """Main application window with component-based architecture and graceful error handling."""
@@ -29,6 +74,8 @@ class MainWindow(QMainWindow):
 
         self.video_label = QLabel()
         self.video_label.setAlignment(Qt.AlignCenter)
+        # Let the layout size the label; frames are scaled to fit it
+        self.video_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.layout.addWidget(self.video_label)
 
         self.status_label = QLabel("Initializing...")
@@ -43,22 +90,44 @@ class MainWindow(QMainWindow):
         }
 
         # Initialize components with error handling
-        self.config = ConfigManager()
+        self.config = get_config_manager()
+        # Frames are downscaled once by this factor before both trackers run
+        self._processing_scale = self.config.get('hardware_config.processing.scale', 0.5)
+        # Hardware tier is fixed for the session; read it once for the status text
+        self._hardware_tier = self.config.hardware_tier
         self.camera = None
         self.gesture_recognizer = None
         self.eye_tracker = None
+        self.worker = None
+        # Persistent BGR buffer overlays are drawn into, wrapped once by a QImage
+        self._display_buf = None
+        self._qimg = None
+        self._frame_wh = None
+        # Label size frames are scaled to, refreshed on window resize
+        self._display_size = None
+        # Status label is refreshed at ~2 Hz and only when its text changes
+        self._active_text = ""
+        self._last_status = ""
+        self._status_last_update = 0.0
 
         self.initialize_components()
 
-        # Timer for UI updates
+        # Capture and inference run on a worker thread; the GUI thread only paints
         if self.components_status['camera']:
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.update_frame)
-            self.timer.start(30)  # ~30 FPS
-            logger.info("UI timer started")
+            self.worker = InferenceWorker(
+                self.camera,
+                eye_tracker=self.eye_tracker if self.components_status['eye_tracking'] else None,
+                gesture_recognizer=self.gesture_recognizer if self.components_status['gesture'] else None,
+                processing_scale=self._processing_scale,
+                skip_unchanged_frames=self.config.get(
+                    'hardware_config.processing.skip_unchanged_frames', False)
+            )
+            self.worker.frame_ready.connect(self.update_frame)
+            self.worker.start()
+            logger.info("Inference worker started")
         else:
             self.status_label.setText("ERROR: Camera failed to initialize")
-            logger.error("Cannot start UI timer - camera not available")
+            logger.error("Cannot start inference worker - camera not available")
 
     def initialize_components(self):
         """Initialize all components with graceful error handling."""
@@ -69,7 +138,7 @@ class MainWindow(QMainWindow):
             self.components_status['camera'] = True
             logger.info("Camera initialized")
         except Exception as e:
-            logger.error(f"Camera initialization failed: {e}")
+            logger.error("Camera initialization failed: %s", e)
             self.status_label.setText(f"Camera Error: {e}")
 
         # Initialize Gesture Recognizer
@@ -81,7 +150,7 @@ class MainWindow(QMainWindow):
             else:
                 logger.warning("Gesture recognizer disabled - model missing")
         except Exception as e:
-            logger.error(f"Gesture recognizer initialization failed: {e}")
+            logger.error("Gesture recognizer initialization failed: %s", e)
 
         # Initialize Eye Tracker
         try:
@@ -92,75 +161,85 @@ class MainWindow(QMainWindow):
             else:
                 logger.warning("Eye tracker disabled - model missing")
         except Exception as e:
-            logger.error(f"Eye tracker initialization failed: {e}")
+            logger.error("Eye tracker initialization failed: %s", e)
 
         # Log final status
         active = [k for k, v in self.components_status.items() if v]
-        logger.info(f"Active components: {', '.join(active)}")
-
-    def update_frame(self):
-        """Update frame with gesture and eye tracking overlays."""
-        if not self.components_status['camera']:
-            return
-
-        ret, frame = self.camera.get_frame()
-        if not ret or frame is None:
-            return
-
-        # Process eye tracking
-        tracker_data = {'gaze_point': None, 'landmarks': None}
-        if self.components_status['eye_tracking']:
-            try:
-                tracker_data = self.eye_tracker.process_frame(frame)
-            except Exception as e:
-                logger.error(f"Eye tracking error: {e}")
-
-        # Process gesture recognition
-        gesture_data = {'gesture': None, 'landmarks': None, 'confidence': 0.0}
-        if self.components_status['gesture']:
-            try:
-                gesture_data = self.gesture_recognizer.process_frame(frame)
-            except Exception as e:
-                logger.error(f"Gesture processing error: {e}")
+        self._active_text = ', '.join(active)
+        logger.info("Active components: %s", self._active_text)
+
+    def update_frame(self, frame, tracker_data, gesture_data):
+        """Draw gesture and eye tracking overlays and display the frame.
+
+        Slot for InferenceWorker.frame_ready; runs on the GUI thread.
+        """
+        # Let the worker emit its next result; anything older is dropped
+        self.worker.frame_consumed()
+
+        # Camera frames are shared with the capture thread; draw on our own buffer
+        frame = self._copy_to_display_buffer(frame)
 
         # Draw overlays
         if gesture_data['landmarks']:
             self.gesture_recognizer.draw_landmarks(frame, gesture_data['landmarks'])
             if gesture_data['gesture']:
                 text = f"{gesture_data['gesture']} {gesture_data['confidence']:.2f}"
-                cv2.putText(frame, text, (10, 50),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                _draw_text(frame, text, (10, 50), 1, _GREEN, 2)
 
         if tracker_data['gaze_point']:
             gx, gy = tracker_data['gaze_point']
-            h, w, _ = frame.shape
-            px, py = int(gx * w), int(gy * h)
-            cv2.circle(frame, (px, py), 10, (0, 0, 255), -1)
-            cv2.circle(frame, (px, py), 15, (0, 0, 255), 2)
-            text = f"Gaze ({gx:.2f}, {gy:.2f})"
-            cv2.putText(frame, text, (10, 90),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+            w, h = self._frame_wh
+            center = (int(gx * w), int(gy * h))
+            cv2.circle(frame, center, 10, _RED, -1)
+            cv2.circle(frame, center, 15, _RED, 2)
+            # One decimal keeps the number of distinct strings small
+            text = f"Gaze ({gx:.1f}, {gy:.1f})"
+            _draw_text(frame, text, (10, 90), 0.7, _RED, 2)
 
         # Update status
-        active = [k for k, v in self.components_status.items() if v]
-        status_text = f"Active: {', '.join(active)}"
-        if self.components_status['camera'] and hasattr(self.camera, 'fps'):
-            status_text = f"FPS: {self.camera.fps} | " + status_text
-        self.status_label.setText(status_text)
+        now = time.monotonic()
+        if now - self._status_last_update > 0.5:
+            self._status_last_update = now
+            status_text = f"Tier: {self._hardware_tier} | Active: {self._active_text}"
+            if self.components_status['camera'] and hasattr(self.camera, 'fps'):
+                status_text = f"FPS: {self.camera.fps} | " + status_text
+            if status_text != self._last_status:
+                self.status_label.setText(status_text)
+                self._last_status = status_text
 
         # Display in UI
-        self.display_image(frame)
-
-    def display_image(self, frame):
-        """Convert and display OpenCV frame in Qt label."""
-        rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
+        self.display_image()
+
+    def _copy_to_display_buffer(self, frame):
+        """Copy frame into the persistent display buffer, reallocating on size change."""
+        if self._display_buf is None or self._display_buf.shape != frame.shape:
+            h, w = frame.shape[:2]
+            self._display_buf = np.empty_like(frame)
+            self._frame_wh = (w, h)
+            self._qimg = QImage(self._display_buf.data, w, h,
+                                self._display_buf.strides[0], QImage.Format_BGR888)
+        np.copyto(self._display_buf, frame)
+        return self._display_buf
+
+    def display_image(self):
+        """Display the BGR display buffer in the Qt label without color conversion."""
+        qt_image = self._qimg
+        if self._display_size is not None and qt_image.size() != self._display_size:
+            # Scale before the pixmap conversion so only the visible pixels are converted
+            qt_image = qt_image.scaled(self._display_size, Qt.KeepAspectRatio,
+                                       Qt.FastTransformation)
         self.video_label.setPixmap(QPixmap.fromImage(qt_image))
 
+    def resizeEvent(self, event):
+        """Cache the video label size that frames are scaled to."""
+        super().resizeEvent(event)
+        size = self.video_label.size()
+        self._display_size = None if size.isEmpty() else size
+
     def closeEvent(self, event):
         """Clean up resources on close."""
+        if self.worker:
+            self.worker.stop()
         if self.camera:
             self.camera.stop()
         event.accept()
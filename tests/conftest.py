@@ -1,15 +1,34 @@
 """Pytest configuration and fixtures for Virtual Desktop Controller tests."""
 import logging
+import sys
+from pathlib import Path
+
 import pytest
 import numpy as np
 from typing import Generator
 
+# Make the application packages under src/ importable, as main.py does
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
 # Configure logging for tests
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Deterministic sample frame, generated once per session
+_RNG = np.random.default_rng(0)
+_SAMPLE = _RNG.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+
+# Constant frames are shared read-only; use blank_frame_mut to draw on one
+_BLANK = np.full((480, 640, 3), 255, dtype=np.uint8)
+_BLANK.setflags(write=False)
+_BLACK = np.zeros((480, 640, 3), dtype=np.uint8)
+_BLACK.setflags(write=False)
+
+# Tests carrying any of these markers are not marked as unit tests
+_EXCLUDED_MARKERS = frozenset(('integration', 'performance'))
+
 
 @pytest.fixture
 def sample_frame() -> np.ndarray:
@@ -18,17 +37,27 @@ def sample_frame() -> np.ndarray:
     Returns:
         Sample frame as numpy array (480, 640, 3)
     """
-    return np.random.randint(0, 256, (480, 640, 3), dtype=np.uint8)
+    return _SAMPLE.copy()
 
 
 @pytest.fixture
 def blank_frame() -> np.ndarray:
     """Provide a blank/white video frame.
     
+    Returns:
+        Read-only blank frame as numpy array (480, 640, 3)
+    """
+    return _BLANK
+
+
+@pytest.fixture
+def blank_frame_mut() -> np.ndarray:
+    """Provide a writable blank/white video frame.
+    
     Returns:
         Blank frame as numpy array (480, 640, 3)
     """
-    return np.ones((480, 640, 3), dtype=np.uint8) * 255
+    return _BLANK.copy()
 
 
 @pytest.fixture
@@ -36,17 +65,17 @@ def black_frame() -> np.ndarray:
     """Provide a black video frame.
     
     Returns:
-        Black frame as numpy array (480, 640, 3)
+        Read-only black frame as numpy array (480, 640, 3)
     """
-    return np.zeros((480, 640, 3), dtype=np.uint8)
+    return _BLACK
 
 
-@pytest.fixture
-def test_config() -> dict:
-    """Provide test configuration.
+@pytest.fixture(scope="session")
+def session_test_config() -> dict:
+    """Provide test configuration shared across the session.
     
     Returns:
-        Dictionary with test configuration
+        Dictionary with test configuration; do not modify
     """
     return {
         'window_size': 30,
@@ -56,6 +85,16 @@ def test_config() -> dict:
 
 
 @pytest.fixture
+def test_config(session_test_config) -> dict:
+    """Provide test configuration.
+    
+    Returns:
+        Copy of the session test configuration, safe to modify
+    """
+    return dict(session_test_config)
+
+
+@pytest.fixture(scope="session")
 def logger() -> logging.Logger:
     """Provide logger for tests.
     
@@ -89,8 +128,9 @@ def pytest_collection_modifyitems(config, items):
         config: Pytest config object
         items: List of test items
     """
+    unit = pytest.mark.unit
     for item in items:
         # Add unit marker by default
-        if not any(marker.name in ['integration', 'performance']
-                  for marker in item.iter_markers()):
-            item.add_marker(pytest.mark.unit)
+        if not any(marker.name in _EXCLUDED_MARKERS
+                   for marker in item.iter_markers()):
+            item.add_marker(unit)
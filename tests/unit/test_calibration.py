@@ -0,0 +1,52 @@
+"""Tests for CalibrationManager iris-to-screen mapping."""
+import numpy as np
+import pytest
+
+from eyetracking.calibration import CalibrationManager
+
+# Screen = M @ (iris_x, iris_y, 1)
+_AFFINE = np.array([[2.0, 0.3, -0.4],
+                    [-0.2, 1.5, -0.1]])
+
+
+def _screen_for(ix, iy):
+    """Apply the known affine map to an iris position."""
+    sx, sy = _AFFINE @ (ix, iy, 1.0)
+    return float(sx), float(sy)
+
+
+@pytest.fixture
+def calibrated():
+    """Provide a manager calibrated on a 3x3 grid of exact affine samples."""
+    manager = CalibrationManager()
+    for ix in (0.3, 0.45, 0.6):
+        for iy in (0.3, 0.45, 0.6):
+            manager.collect_sample(*_screen_for(ix, iy), (ix, iy))
+    assert manager.calibrate()
+    return manager
+
+
+def test_calibrate_recovers_affine_coefficients(calibrated):
+    """Test the fitted coefficients equal the generating affine map."""
+    np.testing.assert_allclose(calibrated.mapping_matrix_x, _AFFINE[0], atol=1e-12)
+    np.testing.assert_allclose(calibrated.mapping_matrix_y, _AFFINE[1], atol=1e-12)
+
+
+def test_map_to_screen_applies_affine_map(calibrated):
+    """Test unseen iris positions map through the fitted affine model."""
+    for iris in [(0.35, 0.5), (0.52, 0.41), (0.4, 0.33)]:
+        assert calibrated.map_to_screen(iris) == pytest.approx(_screen_for(*iris), abs=1e-12)
+
+
+def test_map_to_screen_clamps_to_unit_range(calibrated):
+    """Test mapped positions outside the screen are clamped to 0-1."""
+    assert calibrated.map_to_screen((0.9, 0.05)) == (1.0, 0.0)
+
+
+def test_calibrate_requires_four_points():
+    """Test calibration is refused with fewer than four samples."""
+    manager = CalibrationManager()
+    for iris in [(0.3, 0.3), (0.6, 0.3), (0.3, 0.6)]:
+        manager.collect_sample(*_screen_for(*iris), iris)
+    assert not manager.calibrate()
+    assert manager.map_to_screen((0.4, 0.4)) is None
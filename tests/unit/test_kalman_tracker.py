@@ -0,0 +1,61 @@
+"""Tests for KalmanTracker gaze smoothing."""
+import numpy as np
+import pytest
+
+from eyetracking.kalman_tracker import HAS_SIMDKALMAN, KalmanTracker
+
+
+def _reference_filter(measurements, q, r):
+    """Run the filterpy constant-velocity recurrence on one coordinate.
+
+    Args:
+        measurements: Sequence of scalar position measurements
+        q: Process noise scale (Q = I * q)
+        r: Measurement noise variance
+
+    Returns:
+        Array of filtered positions, one per measurement
+    """
+    F = np.array([[1.0, 1.0], [0.0, 1.0]])
+    H = np.array([[1.0, 0.0]])
+    Q = np.eye(2) * q
+    R = np.array([[r]])
+    I = np.eye(2)
+    x = np.array([[measurements[0]], [0.0]])
+    P = np.eye(2)
+    out = []
+    for z in measurements:
+        # Predict
+        x = F @ x
+        P = F @ P @ F.T + Q
+        # Update (Joseph form, as in filterpy.kalman.KalmanFilter.update)
+        S = H @ P @ H.T + R
+        K = P @ H.T @ np.linalg.inv(S)
+        x = x + K @ (np.array([[z]]) - H @ x)
+        IKH = I - K @ H
+        P = IKH @ P @ IKH.T + K @ R @ K.T
+        out.append(x[0, 0])
+    return np.array(out)
+
+
+@pytest.mark.skipif(not HAS_SIMDKALMAN, reason="simdkalman not installed")
+def test_kalman_matches_filterpy_recurrence():
+    """Test smoothed output matches the reference filter for both coordinates."""
+    q, r = 1e-3, 1e-1
+    rng = np.random.default_rng(42)
+    t = np.arange(40)
+    xs = 0.5 + 0.2 * np.sin(t / 6.0) + rng.normal(0, 0.02, t.size)
+    ys = 0.4 + 0.005 * t + rng.normal(0, 0.02, t.size)
+
+    tracker = KalmanTracker(process_noise=q, measurement_noise=r)
+    smoothed = np.array([tracker.update((x, y)) for x, y in zip(xs, ys)])
+
+    np.testing.assert_allclose(smoothed[:, 0], np.clip(_reference_filter(xs, q, r), 0, 1),
+                               rtol=0, atol=1e-9)
+    np.testing.assert_allclose(smoothed[:, 1], np.clip(_reference_filter(ys, q, r), 0, 1),
+                               rtol=0, atol=1e-9)
+
+
+def test_update_without_detection_returns_none():
+    """Test a missing gaze point yields no smoothed output."""
+    assert KalmanTracker().update(None) is None
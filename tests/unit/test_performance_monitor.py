@@ -0,0 +1,72 @@
+"""Tests for PerformanceMonitor rolling statistics."""
+import numpy as np
+import pytest
+
+from performance import monitor as monitor_module
+from performance.monitor import PerformanceMonitor
+
+
+@pytest.fixture(params=[False, True], ids=["python", "kernels"])
+def update_path(request, monkeypatch):
+    """Select the update() branch under test.
+
+    The kernel branch runs compiled with Numba when it is installed and as plain
+    Python otherwise; either way it exercises the _kernels arithmetic.
+    """
+    monkeypatch.setattr(monitor_module, "HAS_NUMBA", request.param)
+    return request.param
+
+
+@pytest.fixture
+def monitor(update_path):
+    """Provide an initialized monitor with a five-frame window."""
+    mon = PerformanceMonitor(window_size=5)
+    mon.initialize()
+    return mon
+
+
+def _feed(monitor, monkeypatch, frame_times_ms, latencies_ms):
+    """Drive update() with fixed frame intervals instead of the real clock."""
+    now = monitor.last_frame_time
+    for frame_time, latency in zip(frame_times_ms, latencies_ms):
+        now += int(frame_time * 1e6)
+        monkeypatch.setattr(monitor_module, "_pcns", lambda now=now: now)
+        monitor.update(latency)
+
+
+def test_rolling_stats_match_numpy(update_path, monkeypatch):
+    """Test FPS, latency mean and std match NumPy over the rolling window."""
+    rng = np.random.default_rng(7)
+    frame_times = rng.uniform(10.0, 50.0, 13).round(3)
+    latencies = rng.uniform(1.0, 30.0, 13)
+
+    for n in (3, 5, 13):
+        mon = PerformanceMonitor(window_size=5)
+        mon.initialize()
+        _feed(mon, monkeypatch, frame_times[:n], latencies[:n])
+        window = slice(max(0, n - 5), n)
+
+        stats = mon.get_stats()
+        assert stats['frame_count'] == min(n, 5)
+        assert stats['fps'] == pytest.approx(1000.0 / frame_times[window].mean(), rel=1e-9)
+        assert stats['latency_ms'] == pytest.approx(latencies[window].mean(), rel=1e-9)
+        assert stats['latency_std_ms'] == pytest.approx(latencies[window].std(), rel=1e-6)
+
+
+def test_constant_latency_has_zero_std(monitor, monkeypatch):
+    """Test a constant series reports exactly zero spread, never NaN."""
+    _feed(monitor, monkeypatch, [33.3] * 12, [7.1] * 12)
+    assert monitor.latency_ms == pytest.approx(7.1)
+    assert monitor.latency_std_ms == 0.0
+
+
+def test_reset_clears_stats(monitor, monkeypatch):
+    """Test reset() zeroes the stats and restarts the window."""
+    _feed(monitor, monkeypatch, [20.0] * 4, [5.0, 6.0, 7.0, 8.0])
+    monitor.reset()
+    assert monitor.get_stats()['frame_count'] == 0
+    assert monitor.get_stats()['latency_std_ms'] == 0.0
+
+    _feed(monitor, monkeypatch, [25.0], [3.0])
+    assert monitor.get_stats()['latency_ms'] == pytest.approx(3.0)
+    assert monitor.get_stats()['fps'] == pytest.approx(40.0)